@@ -27,6 +27,12 @@ from lom_agent import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Squared range thresholds; compared against distance_to_sq to avoid sqrt
+ABILITY_RANGE_SQ = 600 * 600
+MELEE_RANGE_SQ = 200 * 200
+CHASE_RANGE_SQ = 800 * 800
+MINION_CHASE_RANGE_SQ = 600 * 600
+
 
 class SimpleBot(BaseAgent):
     """A simple bot that pushes lane and fights enemies."""
@@ -37,9 +43,19 @@ class SimpleBot(BaseAgent):
         self.blue_base = Position(800, 2000)
         self.red_base = Position(7200, 2000)
         self.lane_center = Position(4000, 2000)
+        # Set on connect once the team is known
+        self.push_target = self.red_base
+        self.retreat_target = self.blue_base
 
     def on_connect(self, team: str) -> None:
         self.team = team
+        # Resolve push direction once instead of branching every tick
+        if team == "blue":
+            self.push_target = self.red_base
+            self.retreat_target = self.blue_base
+        else:
+            self.push_target = self.blue_base
+            self.retreat_target = self.red_base
         logger.info(f"Connected on team {team}")
 
     def decide(self, obs: Observation) -> List[Action]:
@@ -50,24 +66,19 @@ class SimpleBot(BaseAgent):
         if not me.is_alive:
             return []
 
-        # Determine push direction
-        if self.team == "blue":
-            push_target = self.red_base
-            retreat_target = self.blue_base
-        else:
-            push_target = self.blue_base
-            retreat_target = self.red_base
+        me_pos = me.position
+        attack_range_sq = me.stats.attack_range ** 2
 
         # Check if we should retreat (low health)
         if me.health_percent < 0.25:
             logger.info("Low health, retreating!")
-            return [MoveAction(target=retreat_target)]
+            return [MoveAction(target=self.retreat_target)]
 
         # Try to last-hit minions
         low_hp_minion = obs.get_low_health_enemy_minion(threshold=0.25)
         if low_hp_minion:
-            dist = me.position.distance_to(low_hp_minion.position)
-            if dist <= me.stats.attack_range:
+            dist_sq = me_pos.distance_to_sq(low_hp_minion.position)
+            if dist_sq <= attack_range_sq:
                 return [AttackAction(target_id=low_hp_minion.id)]
             else:
                 # Move toward it
@@ -76,10 +87,10 @@ class SimpleBot(BaseAgent):
         # Look for enemy champions
         nearest_enemy = obs.get_nearest_enemy()
         if nearest_enemy and nearest_enemy.is_alive:
-            enemy_dist = me.position.distance_to(nearest_enemy.position)
+            enemy_dist_sq = me_pos.distance_to_sq(nearest_enemy.position)
 
             # Use abilities if in range
-            if enemy_dist < 600:
+            if enemy_dist_sq < ABILITY_RANGE_SQ:
                 # Try to use Q
                 if me.can_use_ability("Q"):
                     actions.append(AbilityAction(
@@ -89,10 +100,9 @@ class SimpleBot(BaseAgent):
                     ))
 
                 # If enemy is close and we have E (usually mobility/defensive)
-                if enemy_dist < 200 and me.can_use_ability("E"):
-                    # Use E defensively (move away)
-                    escape_dir = nearest_enemy.position.direction_to(me.position)
-                    escape_pos = me.position + escape_dir * 300
+                if enemy_dist_sq < MELEE_RANGE_SQ and me.can_use_ability("E"):
+                    # Use E defensively (step 300 units directly away)
+                    escape_pos = Position.step_from(me_pos, nearest_enemy.position, me_pos, 300)
                     actions.append(AbilityAction(ability="E", target=escape_pos))
 
                 # Use R if enemy is low
@@ -103,9 +113,9 @@ class SimpleBot(BaseAgent):
                     ))
 
             # Auto attack if in range
-            if enemy_dist <= me.stats.attack_range:
+            if enemy_dist_sq <= attack_range_sq:
                 actions.append(AttackAction(target_id=nearest_enemy.id))
-            elif enemy_dist < 800:
+            elif enemy_dist_sq < CHASE_RANGE_SQ:
                 # Move toward enemy to fight
                 actions.append(MoveAction(target=nearest_enemy.position))
 
@@ -115,14 +125,14 @@ class SimpleBot(BaseAgent):
         # Attack nearest enemy minion if no champions around
         nearest_minion = obs.get_nearest_enemy_minion()
         if nearest_minion:
-            dist = me.position.distance_to(nearest_minion.position)
-            if dist <= me.stats.attack_range:
+            dist_sq = me_pos.distance_to_sq(nearest_minion.position)
+            if dist_sq <= attack_range_sq:
                 return [AttackAction(target_id=nearest_minion.id)]
-            elif dist < 600:
+            elif dist_sq < MINION_CHASE_RANGE_SQ:
                 return [MoveAction(target=nearest_minion.position)]
 
         # Default: push toward enemy base
-        return [MoveAction(target=push_target)]
+        return [MoveAction(target=self.push_target)]
 
     def on_match_start(self) -> None:
         logger.info("Match started!")
@@ -0,0 +1,232 @@
+"""
+Optional msgspec-based decoder for observation frames.
+
+msgspec parses the server's tick JSON directly into typed structs in C,
+skipping the per-field dict.get walk that the from_dict classmethods do.
+The structs mirror the wire schema and are converted into the public
+dataclasses from types.py, so user-facing types are unchanged.
+
+When msgspec is not installed, decode_observation and peek_message_type
+are None and AgentClient uses the plain json + from_dict path.
+"""
+
+from typing import Dict, List, Optional
+
+from .types import (
+    AbilityState,
+    AllyState,
+    ChampionStats,
+    EnemyState,
+    Item,
+    LazyList,
+    MinionState,
+    Observation,
+    Position,
+    SelfState,
+    StructureState,
+)
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+if msgspec is not None:
+
+    class _Position(msgspec.Struct):
+        x: float = 0.0
+        y: float = 0.0
+
+    class _Ability(msgspec.Struct):
+        name: str = ""
+        ready: bool = False
+        cooldown_remaining: float = 0.0
+        mana_cost: float = 0.0
+        level_required: Optional[int] = None
+        unlocked: bool = True
+
+    class _Item(msgspec.Struct):
+        id: str = ""
+        name: str = ""
+        cost: int = 0
+        health: Optional[float] = None
+        mana: Optional[float] = None
+        attack_damage: Optional[float] = None
+        ability_power: Optional[float] = None
+        armor: Optional[float] = None
+        magic_resist: Optional[float] = None
+        move_speed: Optional[float] = None
+
+    class _Stats(msgspec.Struct):
+        attack_damage: float = 0.0
+        ability_power: float = 0.0
+        armor: float = 0.0
+        magic_resist: float = 0.0
+        move_speed: float = 0.0
+        attack_range: float = 0.0
+        attack_speed: float = 0.0
+
+    class _Self(msgspec.Struct):
+        id: str = ""
+        champion: str = ""
+        position: _Position = msgspec.field(default_factory=_Position)
+        health: float = 0.0
+        max_health: float = 0.0
+        mana: float = 0.0
+        max_mana: float = 0.0
+        level: int = 1
+        xp: int = 0
+        gold: int = 0
+        is_alive: bool = True
+        abilities: Dict[str, _Ability] = msgspec.field(default_factory=dict)
+        items: List[_Item] = msgspec.field(default_factory=list)
+        stats: _Stats = msgspec.field(default_factory=_Stats)
+
+    class _Ally(msgspec.Struct):
+        id: str = ""
+        champion: str = ""
+        position: _Position = msgspec.field(default_factory=_Position)
+        health: float = 0.0
+        max_health: float = 0.0
+        mana: float = 0.0
+        max_mana: float = 0.0
+        level: int = 1
+        is_alive: bool = True
+
+    class _Enemy(msgspec.Struct):
+        id: str = ""
+        champion: str = ""
+        position: _Position = msgspec.field(default_factory=_Position)
+        health: float = 0.0
+        max_health: float = 0.0
+        level: int = 1
+        is_alive: bool = True
+
+    class _Minion(msgspec.Struct):
+        id: str = ""
+        position: _Position = msgspec.field(default_factory=_Position)
+        health: float = 0.0
+        max_health: float = 0.0
+        is_melee: bool = True
+
+    class _Minions(msgspec.Struct):
+        allied: List[_Minion] = msgspec.field(default_factory=list)
+        enemy: List[_Minion] = msgspec.field(default_factory=list)
+
+    class _NexusSide(msgspec.Struct):
+        health: float = 5000.0
+
+    class _Nexus(msgspec.Struct):
+        blue: _NexusSide = msgspec.field(default_factory=_NexusSide)
+        red: _NexusSide = msgspec.field(default_factory=_NexusSide)
+
+    class _Structures(msgspec.Struct):
+        nexus: _Nexus = msgspec.field(default_factory=_Nexus)
+
+    class _Observation(msgspec.Struct):
+        tick: int = 0
+        match_time: float = 0.0
+        self_state: _Self = msgspec.field(name="self", default_factory=_Self)
+        allies: List[_Ally] = msgspec.field(default_factory=list)
+        enemies: List[_Enemy] = msgspec.field(default_factory=list)
+        minions: _Minions = msgspec.field(default_factory=_Minions)
+        structures: _Structures = msgspec.field(default_factory=_Structures)
+
+    class _Envelope(msgspec.Struct):
+        type: str = ""
+
+    _observation_decoder = msgspec.json.Decoder(_Observation)
+    _envelope_decoder = msgspec.json.Decoder(_Envelope)
+
+    _STAT_KEYS = (
+        "health",
+        "mana",
+        "attack_damage",
+        "ability_power",
+        "armor",
+        "magic_resist",
+        "move_speed",
+    )
+
+    def _position(w: _Position) -> Position:
+        return Position(w.x, w.y)
+
+    def _item(w: _Item) -> Item:
+        stats = {}
+        for key in _STAT_KEYS:
+            value = getattr(w, key)
+            if value is not None:
+                stats[key] = value
+        return Item(w.id, w.name, w.cost, stats)
+
+    def _self_state(w: _Self) -> SelfState:
+        return SelfState(
+            id=w.id,
+            champion=w.champion,
+            position=_position(w.position),
+            health=w.health,
+            max_health=w.max_health,
+            mana=w.mana,
+            max_mana=w.max_mana,
+            level=w.level,
+            xp=w.xp,
+            gold=w.gold,
+            is_alive=w.is_alive,
+            abilities={
+                key: AbilityState(
+                    a.name, a.ready, a.cooldown_remaining, a.mana_cost,
+                    a.level_required, a.unlocked,
+                )
+                for key, a in w.abilities.items()
+            },
+            items=[_item(i) for i in w.items],
+            stats=ChampionStats(
+                w.stats.attack_damage,
+                w.stats.ability_power,
+                w.stats.armor,
+                w.stats.magic_resist,
+                w.stats.move_speed,
+                w.stats.attack_range,
+                w.stats.attack_speed,
+            ),
+        )
+
+    def _ally(w: _Ally) -> AllyState:
+        return AllyState(
+            w.id, w.champion, _position(w.position), w.health, w.max_health,
+            w.mana, w.max_mana, w.level, w.is_alive,
+        )
+
+    def _enemy(w: _Enemy) -> EnemyState:
+        return EnemyState(
+            w.id, w.champion, _position(w.position), w.health, w.max_health,
+            w.level, w.is_alive,
+        )
+
+    def _minion(w: _Minion) -> MinionState:
+        return MinionState(w.id, _position(w.position), w.health, w.max_health, w.is_melee)
+
+    def peek_message_type(raw) -> str:
+        """Read only the 'type' field of a frame without a full parse."""
+        return _envelope_decoder.decode(raw).type
+
+    def decode_observation(raw) -> Observation:
+        """Decode a raw observation frame straight into an Observation."""
+        w = _observation_decoder.decode(raw)
+        return Observation(
+            tick=w.tick,
+            match_time=w.match_time,
+            self_state=_self_state(w.self_state),
+            allies=LazyList(w.allies, _ally),
+            enemies=LazyList(w.enemies, _enemy),
+            allied_minions=LazyList(w.minions.allied, _minion),
+            enemy_minions=LazyList(w.minions.enemy, _minion),
+            structures=StructureState(
+                w.structures.nexus.blue.health, w.structures.nexus.red.health
+            ),
+        )
+
+else:
+    peek_message_type = None
+    decode_observation = None
@@ -0,0 +1,112 @@
+"""
+Specialized dict decoders generated at import time.
+
+The observation schema is fixed; the generic from_dict classmethods pay
+for a dict.get plus default construction on every field even though the
+server sends complete frames. The decoders below are generated from the
+schema as direct-indexing source and compiled once with exec, so the hot
+path does plain d['key'] lookups. Observation.from_dict only falls back
+to the tolerant per-field path when a frame is actually missing keys.
+"""
+
+from .types import (
+    AbilityState,
+    AllyState,
+    ChampionStats,
+    EnemyState,
+    Item,
+    LazyList,
+    MinionState,
+    Observation,
+    Position,
+    SelfState,
+    StructureState,
+)
+
+_NS = {
+    "LazyList": LazyList,
+    "AbilityState": AbilityState,
+    "AllyState": AllyState,
+    "ChampionStats": ChampionStats,
+    "EnemyState": EnemyState,
+    "Item": Item,
+    "MinionState": MinionState,
+    "Observation": Observation,
+    "Position": Position,
+    "SelfState": SelfState,
+    "StructureState": StructureState,
+}
+
+
+def _make(name: str, call_expr: str):
+    """Compile ``def name(d): return <call_expr>`` and return the function."""
+    src = f"def {name}(d):\n    return {call_expr}\n"
+    exec(compile(src, f"<generated {name}>", "exec"), _NS)
+    return _NS[name]
+
+
+_position = _make("_position", "Position(d['x'], d['y'])")
+
+_ability = _make(
+    "_ability",
+    "AbilityState(d['name'], d['ready'], d['cooldown_remaining'], d['mana_cost'],"
+    " d.get('level_required'), d.get('unlocked', True))",
+)
+
+_stats = _make(
+    "_stats",
+    "ChampionStats(d['attack_damage'], d['ability_power'], d['armor'],"
+    " d['magic_resist'], d['move_speed'], d['attack_range'], d['attack_speed'])",
+)
+
+_minion = _make(
+    "_minion",
+    "MinionState(d['id'], _position(d['position']), d['health'], d['max_health'],"
+    " d['is_melee'])",
+)
+
+_enemy = _make(
+    "_enemy",
+    "EnemyState(d['id'], d['champion'], _position(d['position']), d['health'],"
+    " d['max_health'], d['level'], d['is_alive'])",
+)
+
+_ally = _make(
+    "_ally",
+    "AllyState(d['id'], d['champion'], _position(d['position']), d['health'],"
+    " d['max_health'], d['mana'], d['max_mana'], d['level'], d['is_alive'])",
+)
+
+# Item keeps its filtered-stats loop; delegate to the classmethod
+_NS["_item"] = Item.from_dict
+
+_self_state = _make(
+    "_self_state",
+    "SelfState(d['id'], d['champion'], _position(d['position']), d['health'],"
+    " d['max_health'], d['mana'], d['max_mana'], d['level'], d['xp'], d['gold'],"
+    " d['is_alive'],"
+    " {key: _ability(a) for key, a in d['abilities'].items()},"
+    " [_item(i) for i in d['items']],"
+    " _stats(d['stats']))",
+)
+
+_structures = _make(
+    "_structures",
+    "StructureState(d['nexus']['blue']['health'], d['nexus']['red']['health'])",
+)
+
+# Entity lists decode lazily; the tolerant from_dict classmethods act as
+# per-element fallbacks if a frame has sparse entries.
+_NS["_ally_fb"] = AllyState.from_dict
+_NS["_enemy_fb"] = EnemyState.from_dict
+_NS["_minion_fb"] = MinionState.from_dict
+
+decode_observation = _make(
+    "decode_observation",
+    "Observation(d['tick'], d['match_time'], _self_state(d['self']),"
+    " LazyList(d['allies'], _ally, _ally_fb),"
+    " LazyList(d['enemies'], _enemy, _enemy_fb),"
+    " LazyList(d['minions']['allied'], _minion, _minion_fb),"
+    " LazyList(d['minions']['enemy'], _minion, _minion_fb),"
+    " _structures(d['structures']))",
+)
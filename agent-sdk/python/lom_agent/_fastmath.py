@@ -0,0 +1,44 @@
+"""
+Optional compiled kernels for hot nearest-neighbour scans.
+
+When numba is installed the scan runs as machine code via @njit; otherwise
+a vectorized NumPy fallback is used. Callers are expected to guard for
+numpy availability before passing arrays in.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def nearest_idx(px, py, xs, ys):
+        """Index of the point in (xs, ys) closest to (px, py), or -1 if empty."""
+        best = -1
+        best_d = 1e30
+        for i in range(xs.size):
+            dx = xs[i] - px
+            dy = ys[i] - py
+            d = dx * dx + dy * dy
+            if d < best_d:
+                best_d = d
+                best = i
+        return best
+
+else:
+
+    def nearest_idx(px, py, xs, ys):
+        """Index of the point in (xs, ys) closest to (px, py), or -1 if empty."""
+        if xs.size == 0:
+            return -1
+        dx = xs - px
+        dy = ys - py
+        return int(np.argmin(dx * dx + dy * dy))
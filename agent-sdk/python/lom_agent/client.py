@@ -15,7 +15,43 @@ try:
 except ImportError:
     raise ImportError("Please install websockets: pip install websockets")
 
-from .types import Observation, Action
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from .types import (
+    AbilityAction,
+    Action,
+    AttackAction,
+    BuyAction,
+    MoveAction,
+    Observation,
+    StopAction,
+)
+from ._codec import decode_observation, peek_message_type
+
+# Tagged dispatch: one dict lookup per action instead of a per-instance
+# method resolution in the send path.
+_ACTION_SERIALIZERS = {
+    MoveAction: MoveAction.to_json_bytes,
+    StopAction: StopAction.to_json_bytes,
+    AttackAction: AttackAction.to_json_bytes,
+    AbilityAction: AbilityAction.to_json_bytes,
+    BuyAction: BuyAction.to_json_bytes,
+}
+
+
+def _serialize_action(action: Action) -> bytes:
+    serializer = _ACTION_SERIALIZERS.get(type(action))
+    if serializer is not None:
+        return serializer(action)
+    return action.to_json_bytes()
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +129,7 @@ class AgentClient:
         self.running = False
         self.team: Optional[str] = None
         self._reconnect_count = 0
+        self._last_observation: Optional[Observation] = None
 
     async def run(self) -> None:
         """Connect to the server and run the agent loop."""
@@ -115,9 +152,11 @@ class AgentClient:
         """Establish connection and run message loop."""
         logger.info(f"Connecting to {self.config.server_url}...")
 
-        async with websockets.connect(self.config.server_url) as ws:
+        # Compression is a latency tax on small per-tick frames
+        async with websockets.connect(self.config.server_url, compression=None) as ws:
             self.ws = ws
             self._reconnect_count = 0
+            self._last_observation = None
 
             # Authenticate
             await self._authenticate()
@@ -149,25 +188,94 @@ class AgentClient:
             raise Exception(f"Unexpected auth response: {response}")
 
     async def _message_loop(self) -> None:
-        """Process incoming messages."""
-        while self.running:
+        """Process incoming messages.
+
+        A reader task pumps frames into a queue so that bursts of
+        back-to-back observations (server catch-up, or the bot falling
+        behind) can be coalesced: only the newest observation is passed
+        to decide(), since actions for stale ticks would be overwritten
+        anyway. Control messages are still handled in order.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        reader = asyncio.create_task(self._read_frames(queue))
+        try:
+            while self.running:
+                frames = [await queue.get()]
+                while not queue.empty():
+                    frames.append(queue.get_nowait())
+
+                # Find the newest observation; older ones are stale
+                last_obs = -1
+                if len(frames) > 1:
+                    for i, frame in enumerate(frames):
+                        if (
+                            isinstance(frame, (bytes, str, bytearray))
+                            and self._frame_type(frame) == "observation"
+                        ):
+                            last_obs = i
+
+                for i, frame in enumerate(frames):
+                    if frame is None:
+                        return
+                    if isinstance(frame, Exception):
+                        logger.error(f"Error in message loop: {frame}")
+                        raise frame
+                    if i < last_obs and self._frame_type(frame) == "observation":
+                        continue  # superseded by a newer tick
+                    await self._handle_raw(frame)
+                    if not self.running:
+                        return
+        finally:
+            reader.cancel()
+
+    async def _read_frames(self, queue: asyncio.Queue) -> None:
+        """Pump raw frames from the socket into the queue."""
+        try:
+            while self.running:
+                queue.put_nowait(await self.ws.recv())
+        except Exception as e:
+            queue.put_nowait(e)
+        else:
+            queue.put_nowait(None)
+
+    def _frame_type(self, raw) -> Optional[str]:
+        """Cheaply read a frame's message type."""
+        if peek_message_type is not None:
+            return peek_message_type(raw)
+        return self._parse(raw).get("type")
+
+    async def _handle_raw(self, raw) -> None:
+        """Handle a raw frame, decoding observations on the fast path."""
+        if decode_observation is not None and peek_message_type(raw) == "observation":
             try:
-                message = await self._receive()
-                await self._handle_message(message)
-            except asyncio.CancelledError:
-                break
+                observation = decode_observation(raw)
             except Exception as e:
-                logger.error(f"Error in message loop: {e}")
-                raise
+                # Schema drift: fall back to the tolerant dict-based decode
+                logger.debug(f"msgspec decode failed, falling back: {e}")
+                observation = Observation.from_dict(self._parse(raw))
+            await self._decide_and_send(observation)
+            return
+        await self._handle_message(self._parse(raw))
+
+    async def _decide_and_send(self, observation: Observation) -> None:
+        """Run the agent on an observation and send its actions."""
+        # Cap the reuse chain at one tick: _ensure_arrays only clears the
+        # link when a spatial query runs (and never without numpy), so
+        # without this the client would retain every past observation.
+        prev = self._last_observation
+        if prev is not None:
+            prev._reuse_from = None
+        observation._reuse_from = prev
+        self._last_observation = observation
+        actions = self.agent.decide(observation)
+        await self._send_actions(actions)
 
     async def _handle_message(self, message: dict) -> None:
         """Handle an incoming message."""
         msg_type = message.get("type")
 
         if msg_type == "observation":
-            observation = Observation.from_dict(message)
-            actions = self.agent.decide(observation)
-            await self._send_actions(actions)
+            await self._decide_and_send(Observation.from_dict(message))
 
         elif msg_type == "match_start":
             self.agent.on_match_start()
@@ -190,24 +298,40 @@ class AgentClient:
         if not actions:
             return
 
-        msg = {
-            "type": "action",
-            "actions": [a.to_dict() for a in actions],
-        }
-        await self._send(msg)
+        # Actions serialize straight to JSON bytes; no dict or dumps pass
+        payload = (
+            b'{"type":"action","actions":['
+            + b",".join(_serialize_action(a) for a in actions)
+            + b"]}"
+        )
+        if self.ws:
+            await self.ws.send(payload)
 
     async def _send(self, message: dict) -> None:
         """Send a JSON message."""
         if self.ws:
-            await self.ws.send(json.dumps(message))
+            if orjson is not None:
+                await self.ws.send(orjson.dumps(message))
+            else:
+                await self.ws.send(json.dumps(message))
 
-    async def _receive(self) -> dict:
-        """Receive and parse a JSON message."""
+    async def _receive_raw(self):
+        """Receive a raw frame."""
         if not self.ws:
             raise Exception("Not connected")
-        raw = await self.ws.recv()
+        return await self.ws.recv()
+
+    def _parse(self, raw) -> dict:
+        """Parse a raw JSON frame into a dict."""
+        # orjson parses in C and accepts bytes frames without a decode pass
+        if orjson is not None:
+            return orjson.loads(raw)
         return json.loads(raw)
 
+    async def _receive(self) -> dict:
+        """Receive and parse a JSON message."""
+        return self._parse(await self._receive_raw())
+
     def stop(self) -> None:
         """Stop the agent."""
         self.running = False
@@ -224,4 +348,6 @@ def run_agent(agent: BaseAgent, agent_id: str, server_url: str = "ws://localhost
     """
     config = AgentConfig(agent_id=agent_id, server_url=server_url)
     client = AgentClient(config, agent)
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(client.run())
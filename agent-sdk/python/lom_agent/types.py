@@ -3,9 +3,25 @@ Type definitions for League of Molts Agent SDK
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Union
+from math import hypot
+from typing import Optional, List, Dict, Any, FrozenSet, Union
 from enum import Enum
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+from ._fastmath import nearest_idx
+
+# Below this many candidates a plain scan beats building a KD-tree.
+_KDTREE_MIN = 8
+
 
 class Team(Enum):
     BLUE = "blue"
@@ -25,13 +41,20 @@ class AbilityKey(Enum):
     R = "R"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Position:
     x: float
     y: float
 
     def distance_to(self, other: "Position") -> float:
-        return ((self.x - other.x) ** 2 + (self.y - other.y) ** 2) ** 0.5
+        # hypot is a single C call; the ** idiom dispatches __pow__ twice
+        return hypot(self.x - other.x, self.y - other.y)
+
+    def distance_to_sq(self, other: "Position") -> float:
+        """Squared distance; use for range checks to skip the sqrt."""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
 
     def direction_to(self, other: "Position") -> "Position":
         dist = self.distance_to(other)
@@ -45,12 +68,29 @@ class Position:
     def __mul__(self, scalar: float) -> "Position":
         return Position(self.x * scalar, self.y * scalar)
 
+    @staticmethod
+    def step_from(
+        origin: "Position", start: "Position", toward: "Position", distance: float
+    ) -> "Position":
+        """Point `distance` away from `origin` along the start->toward direction.
+
+        Equivalent to ``origin + start.direction_to(toward) * distance``
+        but with a single allocation and no intermediate Positions.
+        """
+        dx = toward.x - start.x
+        dy = toward.y - start.y
+        norm = hypot(dx, dy)
+        if norm == 0:
+            return origin
+        scale = distance / norm
+        return Position(origin.x + dx * scale, origin.y + dy * scale)
+
     @classmethod
     def from_dict(cls, data: Dict[str, float]) -> "Position":
         return cls(x=data.get("x", 0), y=data.get("y", 0))
 
 
-@dataclass
+@dataclass(slots=True)
 class AbilityState:
     name: str
     ready: bool
@@ -71,7 +111,7 @@ class AbilityState:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     id: str
     name: str
@@ -92,7 +132,7 @@ class Item:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChampionStats:
     attack_damage: float
     ability_power: float
@@ -115,7 +155,7 @@ class ChampionStats:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SelfState:
     id: str
     champion: str
@@ -132,19 +172,46 @@ class SelfState:
     items: List[Item]
     stats: ChampionStats
 
+    # Slot-backed lazy caches (cached_property needs a __dict__). A
+    # SelfState is built fresh from each observation, so these never need
+    # explicit invalidation.
+    _health_percent: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _mana_percent: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _ready_abilities: Optional[FrozenSet[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def health_percent(self) -> float:
-        return self.health / self.max_health if self.max_health > 0 else 0
+        pct = self._health_percent
+        if pct is None:
+            pct = self.health / self.max_health if self.max_health > 0 else 0
+            self._health_percent = pct
+        return pct
 
     @property
     def mana_percent(self) -> float:
-        return self.mana / self.max_mana if self.max_mana > 0 else 0
+        pct = self._mana_percent
+        if pct is None:
+            pct = self.mana / self.max_mana if self.max_mana > 0 else 0
+            self._mana_percent = pct
+        return pct
+
+    @property
+    def ready_abilities(self) -> FrozenSet[str]:
+        """Keys of abilities that are off cooldown, unlocked, and affordable."""
+        ready = self._ready_abilities
+        if ready is None:
+            ready = frozenset(
+                key
+                for key, ability in self.abilities.items()
+                if ability.ready and ability.unlocked and self.mana >= ability.mana_cost
+            )
+            self._ready_abilities = ready
+        return ready
 
     def can_use_ability(self, key: str) -> bool:
-        ability = self.abilities.get(key)
-        if not ability:
-            return False
-        return ability.ready and ability.unlocked and self.mana >= ability.mana_cost
+        return key in self.ready_abilities
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SelfState":
@@ -172,7 +239,7 @@ class SelfState:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AllyState:
     id: str
     champion: str
@@ -203,7 +270,7 @@ class AllyState:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EnemyState:
     id: str
     champion: str
@@ -230,7 +297,7 @@ class EnemyState:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MinionState:
     id: str
     position: Position
@@ -253,7 +320,7 @@ class MinionState:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StructureState:
     # TODO: Full structure tracking
     blue_nexus_health: float
@@ -268,7 +335,60 @@ class StructureState:
         )
 
 
-@dataclass
+class LazyList:
+    """List-like wrapper that decodes its entries on first access.
+
+    Observation entity lists are wrapped in this so ticks whose decide()
+    never touches them (early exits like retreating or being dead) pay
+    nothing for decoding minions, allies, or enemies.
+    """
+
+    __slots__ = ("_raw", "_decode", "_fallback", "_items")
+
+    def __init__(self, raw, decode, fallback=None):
+        self._raw = raw
+        self._decode = decode
+        self._fallback = fallback
+        self._items = None
+
+    def _materialize(self):
+        items = self._items
+        if items is None:
+            try:
+                items = [self._decode(entry) for entry in self._raw]
+            except (KeyError, TypeError):
+                if self._fallback is None:
+                    raise
+                items = [self._fallback(entry) for entry in self._raw]
+            self._items = items
+            self._raw = ()
+        return items
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __getitem__(self, index):
+        return self._materialize()[index]
+
+    def __len__(self):
+        items = self._items
+        return len(self._raw) if items is None else len(items)
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __eq__(self, other):
+        if isinstance(other, LazyList):
+            return self._materialize() == other._materialize()
+        if isinstance(other, list):
+            return self._materialize() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"LazyList({self._materialize()!r})"
+
+
+@dataclass(slots=True)
 class Observation:
     tick: int
     match_time: float
@@ -279,10 +399,66 @@ class Observation:
     enemy_minions: List[MinionState]
     structures: StructureState
 
+    # SoA position caches, built lazily on the first query so ticks that
+    # never ask a spatial question (dead, retreating) allocate nothing.
+    _arrays_built: bool = field(default=False, init=False, repr=False, compare=False)
+    _enemy_xy: Any = field(default=None, init=False, repr=False, compare=False)
+    _enemy_alive: Any = field(default=None, init=False, repr=False, compare=False)
+    _enemy_minion_xy: Any = field(default=None, init=False, repr=False, compare=False)
+    _enemy_minion_hp: Any = field(default=None, init=False, repr=False, compare=False)
+    _enemy_minion_tree: Any = field(default=None, init=False, repr=False, compare=False)
+    # Previous tick's observation, set by the client so an unchanged
+    # minion layout can reuse its KD-tree instead of rebuilding.
+    _reuse_from: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def _ensure_arrays(self) -> None:
+        if self._arrays_built or np is None:
+            return
+        self._build_arrays()
+        prev = self._reuse_from
+        self._reuse_from = None  # don't chain-retain old observations
+        if (
+            prev is not None
+            and prev._enemy_minion_tree is not None
+            and prev._enemy_minion_xy is not None
+            and np.array_equal(prev._enemy_minion_xy, self._enemy_minion_xy)
+        ):
+            self._enemy_minion_tree = prev._enemy_minion_tree
+        self._arrays_built = True
+
+    def _build_arrays(self) -> None:
+        """Pack entity positions into contiguous arrays for fast NN queries."""
+        self._enemy_xy = np.array(
+            [(e.position.x, e.position.y) for e in self.enemies], dtype=np.float32
+        ).reshape(-1, 2)
+        self._enemy_alive = np.array([e.is_alive for e in self.enemies], dtype=bool)
+        self._enemy_minion_xy = np.array(
+            [(m.position.x, m.position.y) for m in self.enemy_minions], dtype=np.float32
+        ).reshape(-1, 2)
+        hp = np.array([m.health for m in self.enemy_minions], dtype=np.float32)
+        max_hp = np.array([m.max_health for m in self.enemy_minions], dtype=np.float32)
+        self._enemy_minion_hp = np.divide(hp, max_hp, out=np.zeros_like(hp), where=max_hp > 0)
+
+    def _minion_tree(self):
+        """KD-tree over enemy minion positions, built lazily on first query."""
+        if self._enemy_minion_tree is None:
+            self._enemy_minion_tree = cKDTree(self._enemy_minion_xy)
+        return self._enemy_minion_tree
+
     def get_nearest_enemy(self) -> Optional[EnemyState]:
         """Get the nearest visible enemy champion."""
         if not self.enemies:
             return None
+        self._ensure_arrays()
+        if self._enemy_xy is not None:
+            alive = np.flatnonzero(self._enemy_alive)
+            if alive.size == 0:
+                return None
+            pos = self.self_state.position
+            xy = self._enemy_xy[alive]
+            # argmin of d^2 == argmin of d; no sqrt needed
+            i = nearest_idx(pos.x, pos.y, xy[:, 0], xy[:, 1])
+            return self.enemies[int(alive[i])]
         return min(
             [e for e in self.enemies if e.is_alive],
             key=lambda e: self.self_state.position.distance_to(e.position),
@@ -293,6 +469,16 @@ class Observation:
         """Get the nearest enemy minion."""
         if not self.enemy_minions:
             return None
+        self._ensure_arrays()
+        if self._enemy_minion_xy is not None:
+            pos = self.self_state.position
+            if cKDTree is not None and len(self.enemy_minions) >= _KDTREE_MIN:
+                _, i = self._minion_tree().query((pos.x, pos.y), k=1)
+            else:
+                i = nearest_idx(
+                    pos.x, pos.y, self._enemy_minion_xy[:, 0], self._enemy_minion_xy[:, 1]
+                )
+            return self.enemy_minions[int(i)]
         return min(
             self.enemy_minions,
             key=lambda m: self.self_state.position.distance_to(m.position),
@@ -301,6 +487,20 @@ class Observation:
 
     def get_low_health_enemy_minion(self, threshold: float = 0.3) -> Optional[MinionState]:
         """Get a low health enemy minion (for last-hitting)."""
+        if not self.enemy_minions:
+            return None
+        self._ensure_arrays()
+        if self._enemy_minion_hp is not None:
+            candidates = np.flatnonzero(self._enemy_minion_hp <= threshold)
+            if candidates.size == 0:
+                return None
+            pos = self.self_state.position
+            xy = self._enemy_minion_xy[candidates]
+            if cKDTree is not None and candidates.size >= _KDTREE_MIN:
+                _, i = cKDTree(xy).query((pos.x, pos.y), k=1)
+            else:
+                i = nearest_idx(pos.x, pos.y, xy[:, 0], xy[:, 1])
+            return self.enemy_minions[int(candidates[int(i)])]
         low_health = [m for m in self.enemy_minions if m.health_percent <= threshold]
         if not low_health:
             return None
@@ -311,22 +511,27 @@ class Observation:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Observation":
+        try:
+            # Fast path: schema-specialized decoder with direct indexing
+            return _decoders.decode_observation(data)
+        except (KeyError, TypeError):
+            pass
         minions = data.get("minions", {})
         return cls(
             tick=data.get("tick", 0),
             match_time=data.get("match_time", 0),
             self_state=SelfState.from_dict(data.get("self", {})),
-            allies=[AllyState.from_dict(a) for a in data.get("allies", [])],
-            enemies=[EnemyState.from_dict(e) for e in data.get("enemies", [])],
-            allied_minions=[MinionState.from_dict(m) for m in minions.get("allied", [])],
-            enemy_minions=[MinionState.from_dict(m) for m in minions.get("enemy", [])],
+            allies=LazyList(data.get("allies", []), AllyState.from_dict),
+            enemies=LazyList(data.get("enemies", []), EnemyState.from_dict),
+            allied_minions=LazyList(minions.get("allied", []), MinionState.from_dict),
+            enemy_minions=LazyList(minions.get("enemy", []), MinionState.from_dict),
             structures=StructureState.from_dict(data.get("structures", {})),
         )
 
 
 # === ACTIONS ===
 
-@dataclass
+@dataclass(slots=True)
 class MoveAction:
     target: Position
 
@@ -336,14 +541,23 @@ class MoveAction:
             "target": {"x": self.target.x, "y": self.target.y},
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize directly to JSON bytes; the schema is fixed per class."""
+        return (
+            f'{{"action_type":"move","target":{{"x":{self.target.x},"y":{self.target.y}}}}}'
+        ).encode()
 
-@dataclass
+
+@dataclass(slots=True)
 class StopAction:
     def to_dict(self) -> Dict[str, Any]:
         return {"action_type": "stop"}
 
+    def to_json_bytes(self) -> bytes:
+        return b'{"action_type":"stop"}'
+
 
-@dataclass
+@dataclass(slots=True)
 class AttackAction:
     target_id: str
 
@@ -353,8 +567,11 @@ class AttackAction:
             "target_id": self.target_id,
         }
 
+    def to_json_bytes(self) -> bytes:
+        return f'{{"action_type":"attack","target_id":"{self.target_id}"}}'.encode()
 
-@dataclass
+
+@dataclass(slots=True)
 class AbilityAction:
     ability: str  # "Q", "W", "E", "R"
     target: Optional[Position] = None
@@ -371,8 +588,16 @@ class AbilityAction:
             result["target_id"] = self.target_id
         return result
 
+    def to_json_bytes(self) -> bytes:
+        parts = [f'"action_type":"ability","ability":"{self.ability}"']
+        if self.target:
+            parts.append(f'"target":{{"x":{self.target.x},"y":{self.target.y}}}')
+        if self.target_id:
+            parts.append(f'"target_id":"{self.target_id}"')
+        return ("{" + ",".join(parts) + "}").encode()
+
 
-@dataclass
+@dataclass(slots=True)
 class BuyAction:
     item_id: str
 
@@ -382,5 +607,11 @@ class BuyAction:
             "item_id": self.item_id,
         }
 
+    def to_json_bytes(self) -> bytes:
+        return f'{{"action_type":"buy","item_id":"{self.item_id}"}}'.encode()
+
 
 Action = Union[MoveAction, StopAction, AttackAction, AbilityAction, BuyAction]
+
+# Imported last: the generated decoders need the classes above to exist
+from . import _decoders  # noqa: E402
@@ -0,0 +1,38 @@
+"""
+Compiled kernels for per-tick hot loops.
+
+When numba is installed the kernels are JIT-compiled (cached across runs);
+otherwise numpy reductions serve as the fallback. Callers must handle
+count_alive being None when neither dependency is available.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def count_alive(team_ids, alive, out):
+        """Count living champions per team into out (index = team id)."""
+        out[:] = 0
+        for i in range(team_ids.shape[0]):
+            if alive[i]:
+                out[team_ids[i]] += 1
+
+elif np is not None:
+
+    def count_alive(team_ids, alive, out):
+        """Count living champions per team into out (index = team id)."""
+        out[0] = np.count_nonzero(alive & (team_ids == 0))
+        out[1] = np.count_nonzero(alive & (team_ids == 1))
+
+else:
+    count_alive = None
@@ -4,105 +4,149 @@ Commentary Generator
 Generates commentary using templates and optional LLM enhancement.
 """
 
+import asyncio
 import os
 import random
+import string
 from typing import Optional
 
 from event_detector import GameEvent, EventType
 
 # Template-based commentary for fast response
 TEMPLATES = {
-    EventType.MATCH_START: [
+    EventType.MATCH_START: (
         "Welcome to the Rift! The match has begun!",
         "Let's get ready to rumble! Match is starting!",
         "Champions are taking their positions. The battle begins!",
-    ],
+    ),
 
-    EventType.FIRST_BLOOD: [
+    EventType.FIRST_BLOOD: (
         "{killer} draws first blood on {victim}!",
         "FIRST BLOOD! {killer} takes down {victim}!",
         "{killer} gets the first kill of the game against {victim}!",
-    ],
+    ),
 
-    EventType.CHAMPION_KILL: [
+    EventType.CHAMPION_KILL: (
         "{killer} eliminates {victim}!",
         "{victim} has been slain by {killer}.",
         "{killer} takes down {victim}!",
         "And {victim} goes down to {killer}!",
-    ],
+    ),
 
-    EventType.DOUBLE_KILL: [
+    EventType.DOUBLE_KILL: (
         "DOUBLE KILL for {champion}!",
         "{champion} picks up a double kill!",
         "Two down! {champion} is on fire!",
-    ],
+    ),
 
-    EventType.TRIPLE_KILL: [
+    EventType.TRIPLE_KILL: (
         "TRIPLE KILL! {champion} is unstoppable!",
         "{champion} with the TRIPLE KILL!",
         "Three kills for {champion}! What a play!",
-    ],
+    ),
 
-    EventType.MULTI_KILL: [
+    EventType.MULTI_KILL: (
         "{champion} IS ON A RAMPAGE! {count} KILLS!",
         "LEGENDARY! {champion} with {count} kills!",
         "{champion} is absolutely dominating with {count} kills!",
-    ],
+    ),
 
-    EventType.SHUTDOWN: [
+    EventType.SHUTDOWN: (
         "{killer} SHUTS DOWN {victim}! End of a {streak} kill streak!",
         "The rampage is over! {killer} stops {victim}!",
         "{killer} puts an end to {victim}'s killing spree!",
-    ],
+    ),
 
-    EventType.ACE: [
+    EventType.ACE: (
         "ACE! {by_team} team wipes out {aced_team}!",
         "ACED! Not a single {aced_team} champion standing!",
         "Total annihilation! {by_team} aces {aced_team}!",
-    ],
+    ),
 
-    EventType.TOWER_DESTROYED: [
+    EventType.TOWER_DESTROYED: (
         "{team}'s tower has been destroyed!",
         "Tower down for {team}!",
         "Another tower falls for {team}!",
-    ],
+    ),
 
-    EventType.NEXUS_LOW: [
+    EventType.NEXUS_LOW: (
         "{team}'s nexus is critical! Only {health} HP remaining!",
         "The {team} nexus is under heavy attack!",
         "Things are looking dire for {team}!",
-    ],
+    ),
 
-    EventType.NEXUS_DESTROYED: [
+    EventType.NEXUS_DESTROYED: (
         "{winner} destroys the nexus! VICTORY!",
         "GG! {winner} wins the match!",
         "And that's the game! {winner} takes the victory!",
-    ],
+    ),
 
-    EventType.LEVEL_UP: [
+    EventType.LEVEL_UP: (
         "{champion} reaches level {new_level}.",
         "{champion} levels up to {new_level}!",
-    ],
+    ),
 
-    EventType.ULTIMATE_READY: [
+    EventType.ULTIMATE_READY: (
         "{champion}'s ultimate is now available!",
         "Watch out! {champion} has their ultimate ready!",
-    ],
+    ),
 
-    EventType.MATCH_END: [
+    EventType.MATCH_END: (
         "GG! {winner} wins in {duration:.0f} seconds!",
         "What a match! {winner} takes the victory!",
         "And it's over! {winner} claims victory!",
-    ],
+    ),
 }
 
 
+def _compile_template(template: str):
+    """Parse a format string once into (literal, field, spec, conversion) segments."""
+    return tuple(string.Formatter().parse(template))
+
+
+# Pre-parsed templates: str.format re-parses the format string on every
+# call, so render from these segment tuples instead.
+_COMPILED_TEMPLATES = {
+    event_type: tuple((template, _compile_template(template)) for template in templates)
+    for event_type, templates in TEMPLATES.items()
+}
+
+
+# Event types with at least one template; lets callers skip events that
+# would render to nothing without touching the template dict.
+_TEMPLATED_EVENTS = frozenset(_COMPILED_TEMPLATES)
+
+
+def _render(segments, data) -> str:
+    """Render pre-parsed segments with event data (raises KeyError on a missing field)."""
+    parts = []
+    for literal, field_name, spec, conversion in segments:
+        if literal:
+            parts.append(literal)
+        if field_name is not None:
+            value = data[field_name]
+            if conversion == "s":
+                value = str(value)
+            elif conversion == "r":
+                value = repr(value)
+            parts.append(format(value, spec) if spec else str(value))
+    return "".join(parts)
+
+
 class CommentaryGenerator:
     """Generates commentary for game events."""
 
+    # Bound on cached LLM lines; identical events (same type + data) reuse
+    # the previous response instead of paying another round trip.
+    _LLM_CACHE_SIZE = 128
+
     def __init__(self, enable_llm: bool = False):
         self.enable_llm = enable_llm
         self.anthropic_client = None
+        self._llm_cache = {}
+        # Own RNG instance: avoids the module-level lock-shared state
+        # when several generators run across threads
+        self._rng = random.Random()
 
         if enable_llm:
             try:
@@ -112,17 +156,21 @@ class CommentaryGenerator:
                 print("Warning: anthropic package not installed, LLM disabled")
                 self.enable_llm = False
 
+    def has_template(self, event_type: EventType) -> bool:
+        """Whether generate_template can produce a line for this event type."""
+        return event_type in _TEMPLATED_EVENTS
+
     def generate_template(self, event: GameEvent) -> Optional[str]:
         """Generate commentary from templates (fast path)."""
-        templates = TEMPLATES.get(event.event_type)
+        templates = _COMPILED_TEMPLATES.get(event.event_type)
         if not templates:
             return None
 
-        template = random.choice(templates)
+        template, segments = self._rng.choice(templates)
 
-        # Format with event data
+        # Render with event data
         try:
-            return template.format(**event.data)
+            return _render(segments, event.data)
         except KeyError:
             return template
 
@@ -131,20 +179,36 @@ class CommentaryGenerator:
         if not self.enable_llm or not self.anthropic_client:
             return None
 
+        try:
+            cache_key = (event.event_type, tuple(sorted(event.data.items())))
+        except TypeError:
+            cache_key = None
+        if cache_key is not None and cache_key in self._llm_cache:
+            return self._llm_cache[cache_key]
+
         # Build context for LLM
         prompt = self._build_enhancement_prompt(event)
 
         try:
-            response = self.anthropic_client.messages.create(
+            # The anthropic client is synchronous; run it in a worker
+            # thread so the API round trip doesn't block the event loop.
+            response = await asyncio.to_thread(
+                self.anthropic_client.messages.create,
                 model="claude-3-haiku-20240307",  # Fast model for real-time
                 max_tokens=100,
                 messages=[{"role": "user", "content": prompt}],
             )
-            return response.content[0].text.strip()
+            text = response.content[0].text.strip()
         except Exception as e:
             print(f"LLM enhancement failed: {e}")
             return None
 
+        if cache_key is not None:
+            if len(self._llm_cache) >= self._LLM_CACHE_SIZE:
+                self._llm_cache.pop(next(iter(self._llm_cache)))
+            self._llm_cache[cache_key] = text
+        return text
+
     def _build_enhancement_prompt(self, event: GameEvent) -> str:
         """Build prompt for LLM enhancement."""
         base = f"""You are an esports commentator for a MOBA game called League of Molts.
@@ -4,9 +4,45 @@ Event Detector
 Analyzes game state changes to detect significant events for commentary.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List, Dict, Any
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Mapping, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from _kernels import count_alive
+
+_BLUE = 0
+_RED = 1
+_TEAM_IDS = {"blue": _BLUE, "red": _RED}
+_TEAM_NAMES = ("blue", "red")
+_ENEMY_NAME = ("red", "blue")  # indexed by team id
+
+# Initial SoA slot capacity; grown 2x on overflow
+_INITIAL_SLOTS = 32
+
+# Grid cell edge for the optional spatial killer lookup; generous next to
+# typical kill ranges so the victim's 3x3 neighborhood covers the fight
+_CELL_SIZE = 800.0
+
+# Shared fallback position for frames missing the key; never mutated,
+# only read, so one instance can back every default
+_ORIGIN = {"x": 0.0, "y": 0.0}
+
+# Kill payload layout, shared so the keys aren't rebuilt per death
+_KILL_KEYS = (
+    "victim_id",
+    "victim",
+    "victim_team",
+    "killer_id",
+    "killer",
+    "killer_team",
+)
 
 
 class EventType(Enum):
@@ -43,59 +79,134 @@ class EventType(Enum):
     MATCH_END = "match_end"
 
 
-@dataclass
+# Multikill tiers by in-window kill count; anything higher is MULTI_KILL
+_MULTIKILL = {
+    2: EventType.DOUBLE_KILL,
+    3: EventType.TRIPLE_KILL,
+}
+
+# Events worth LLM enhancement; built once rather than per is_major call
+_MAJOR_EVENTS = frozenset({
+    EventType.FIRST_BLOOD,
+    EventType.DOUBLE_KILL,
+    EventType.TRIPLE_KILL,
+    EventType.MULTI_KILL,
+    EventType.ACE,
+    EventType.SHUTDOWN,
+    EventType.TOWER_DESTROYED,
+    EventType.NEXUS_LOW,
+    EventType.NEXUS_DESTROYED,
+    EventType.TEAMFIGHT_END,
+    EventType.BIG_PLAY,
+    EventType.MATCH_END,
+})
+
+
+# Shared read-only default so data-less events skip a dict allocation
+_EMPTY_DATA: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(slots=True)
 class GameEvent:
     """Represents a detected game event."""
     event_type: EventType
     timestamp: float
     tick: int
-    data: Dict[str, Any] = field(default_factory=dict)
+    data: Mapping[str, Any] = field(default_factory=lambda: _EMPTY_DATA)
 
     @property
     def is_major(self) -> bool:
         """Is this a major event worth LLM enhancement?"""
-        major_types = {
-            EventType.FIRST_BLOOD,
-            EventType.DOUBLE_KILL,
-            EventType.TRIPLE_KILL,
-            EventType.MULTI_KILL,
-            EventType.ACE,
-            EventType.SHUTDOWN,
-            EventType.TOWER_DESTROYED,
-            EventType.NEXUS_LOW,
-            EventType.NEXUS_DESTROYED,
-            EventType.TEAMFIGHT_END,
-            EventType.BIG_PLAY,
-            EventType.MATCH_END,
-        }
-        return self.event_type in major_types
-
-
-@dataclass
+        return self.event_type in _MAJOR_EVENTS
+
+
+@dataclass(slots=True)
 class ChampionState:
     """Tracked state for a champion."""
     id: str
     champion: str
     team: str
+    team_id: int  # 0 = blue, 1 = red; team keeps the name for payloads
     health: float
     max_health: float
     level: int
     is_alive: bool
     position: Dict[str, float]
     kill_streak: int = 0
-    recent_kills: List[float] = field(default_factory=list)  # timestamps
+    recent_kills: deque = field(default_factory=deque)  # timestamps
 
 
 class EventDetector:
     """Detects game events by comparing state changes."""
 
-    def __init__(self):
-        self.previous_state: Optional[Dict] = None
+    def __init__(self, use_grid: bool = False):
+        # use_grid partitions champions into per-team spatial grids for the
+        # killer lookup. Break-even at the standard 10 champions; worth
+        # enabling for larger custom modes.
+        self.use_grid = use_grid
         self.champion_states: Dict[str, ChampionState] = {}
         self.first_blood_occurred = False
         self.team_alive_count: Dict[str, int] = {"blue": 0, "red": 0}
         self.towers_destroyed: Dict[str, int] = {"blue": 0, "red": 0}
         self.match_started = False
+        # Edge trigger for NEXUS_LOW; reset if the nexus recovers
+        self._nexus_low: Dict[str, bool] = {"blue": False, "red": False}
+
+        # SoA mirror of champion positions/teams/liveness, indexed by slot,
+        # used for the vectorized killer lookup when numpy is available.
+        self._slots: Dict[str, int] = {}
+        self._slot_states: List[ChampionState] = []
+        # Per-team grids: cell -> slots, plus each slot's current cell
+        self._grids: Tuple[Dict, Dict] = ({}, {})
+        self._slot_cells: List[Optional[Tuple[int, int]]] = []
+        if np is not None:
+            self._pos_x = np.zeros(_INITIAL_SLOTS)
+            self._pos_y = np.zeros(_INITIAL_SLOTS)
+            self._team_ids = np.zeros(_INITIAL_SLOTS, dtype=np.int8)
+            self._alive = np.zeros(_INITIAL_SLOTS, dtype=bool)
+            self._alive_counts = np.zeros(2, dtype=np.int64)
+
+        # Per-tick pipeline; handlers share detect()'s events list and
+        # bound-method lookup is paid once here instead of every tick
+        self._handlers = (
+            self._match_start,
+            self._process_champions,
+            self._check_ace,
+            self._process_structures,
+            self._match_end,
+        )
+
+    def _new_slot(self, state: ChampionState) -> int:
+        """Register a champion in the SoA arrays, growing them if needed."""
+        slot = len(self._slot_states)
+        self._slot_states.append(state)
+        self._slot_cells.append(None)
+        self._slots[state.id] = slot
+        if np is not None and slot >= self._pos_x.shape[0]:
+            for name in ("_pos_x", "_pos_y", "_team_ids", "_alive"):
+                arr = getattr(self, name)
+                setattr(self, name, np.resize(arr, arr.shape[0] * 2))
+        return slot
+
+    def _update_slot(self, slot: int, state: ChampionState) -> None:
+        if self.use_grid:
+            cell = (
+                int(state.position["x"] / _CELL_SIZE),
+                int(state.position["y"] / _CELL_SIZE),
+            )
+            old_cell = self._slot_cells[slot]
+            if cell != old_cell:
+                grid = self._grids[state.team_id]
+                if old_cell is not None:
+                    grid[old_cell].remove(slot)
+                grid.setdefault(cell, []).append(slot)
+                self._slot_cells[slot] = cell
+        if np is None:
+            return
+        self._pos_x[slot] = state.position["x"]
+        self._pos_y[slot] = state.position["y"]
+        self._team_ids[slot] = state.team_id
+        self._alive[slot] = state.is_alive
 
     def detect(self, current_state: Dict) -> List[GameEvent]:
         """Detect events from the current game state."""
@@ -103,8 +214,17 @@ class EventDetector:
         tick = current_state.get("tick", 0)
         timestamp = current_state.get("match_time", 0.0)
 
-        # Match start
-        if not self.match_started and current_state.get("status") == "playing":
+        for handler in self._handlers:
+            handler(current_state, tick, timestamp, events)
+
+        return events
+
+    def _match_start(
+        self, state: Dict, tick: int, timestamp: float,
+        events: List[GameEvent],
+    ) -> None:
+        """Emit MATCH_START once the match begins."""
+        if not self.match_started and state.get("status") == "playing":
             self.match_started = True
             events.append(GameEvent(
                 event_type=EventType.MATCH_START,
@@ -112,60 +232,63 @@ class EventDetector:
                 tick=tick,
             ))
 
-        # Process champions
-        champions = current_state.get("champions", [])
-        for champ_data in champions:
-            events.extend(self._process_champion(champ_data, tick, timestamp))
-
-        # Check for ace
-        events.extend(self._check_ace(tick, timestamp))
-
-        # Process structures
-        events.extend(self._process_structures(current_state, tick, timestamp))
-
-        # Match end
-        if current_state.get("status") == "ended":
+    def _process_champions(
+        self, state: Dict, tick: int, timestamp: float,
+        events: List[GameEvent],
+    ) -> None:
+        """Process every champion in the frame."""
+        for champ_data in state.get("champions", []):
+            self._process_champion(champ_data, tick, timestamp, events)
+
+    def _match_end(
+        self, state: Dict, tick: int, timestamp: float,
+        events: List[GameEvent],
+    ) -> None:
+        """Emit MATCH_END when the match is over."""
+        if state.get("status") == "ended":
             events.append(GameEvent(
                 event_type=EventType.MATCH_END,
                 timestamp=timestamp,
                 tick=tick,
                 data={
-                    "winner": current_state.get("winner"),
+                    "winner": state.get("winner"),
                     "duration": timestamp,
                 },
             ))
 
-        self.previous_state = current_state
-        return events
-
     def _process_champion(
-        self, champ_data: Dict, tick: int, timestamp: float
-    ) -> List[GameEvent]:
-        """Process champion state changes."""
-        events = []
-        champ_id = champ_data.get("id", "")
+        self, champ_data: Dict, tick: int, timestamp: float,
+        events: List[GameEvent],
+    ) -> None:
+        """Process champion state changes, appending events to events."""
+        g = champ_data.get  # bound once; called ~8 times per champion per tick
+        champ_id = g("id", "")
 
         # Get or create state
         if champ_id not in self.champion_states:
-            self.champion_states[champ_id] = ChampionState(
+            team = g("team", "blue")
+            state = ChampionState(
                 id=champ_id,
-                champion=champ_data.get("champion", "Unknown"),
-                team=champ_data.get("team", "blue"),
-                health=champ_data.get("health", 0),
-                max_health=champ_data.get("max_health", 600),
-                level=champ_data.get("level", 1),
-                is_alive=champ_data.get("is_alive", True),
-                position=champ_data.get("position", {"x": 0, "y": 0}),
+                champion=g("champion", "Unknown"),
+                team=team,
+                team_id=_TEAM_IDS.get(team, 0),
+                health=g("health", 0),
+                max_health=g("max_health", 600),
+                level=g("level", 1),
+                is_alive=g("is_alive", True),
+                position=g("position", _ORIGIN),
             )
-            return events
+            self.champion_states[champ_id] = state
+            self._update_slot(self._new_slot(state), state)
+            return
 
         prev_state = self.champion_states[champ_id]
-        is_alive = champ_data.get("is_alive", True)
-        level = champ_data.get("level", 1)
+        is_alive = g("is_alive", True)
+        level = g("level", 1)
 
         # Death detection
         if prev_state.is_alive and not is_alive:
-            events.extend(self._on_champion_death(prev_state, tick, timestamp))
+            self._on_champion_death(prev_state, tick, timestamp, events)
 
         # Respawn
         if not prev_state.is_alive and is_alive:
@@ -199,31 +322,28 @@ class EventDetector:
                 ))
 
         # Update state
-        prev_state.health = champ_data.get("health", 0)
-        prev_state.max_health = champ_data.get("max_health", 600)
+        prev_state.health = g("health", 0)
+        prev_state.max_health = g("max_health", 600)
         prev_state.level = level
         prev_state.is_alive = is_alive
-        prev_state.position = champ_data.get("position", {"x": 0, "y": 0})
-
-        return events
+        prev_state.position = g("position", _ORIGIN)
+        self._update_slot(self._slots[champ_id], prev_state)
 
     def _on_champion_death(
-        self, victim: ChampionState, tick: int, timestamp: float
-    ) -> List[GameEvent]:
-        """Handle a champion death."""
-        events = []
-
+        self, victim: ChampionState, tick: int, timestamp: float,
+        events: List[GameEvent],
+    ) -> None:
+        """Handle a champion death, appending events to events."""
         # Find likely killer (closest enemy champion)
         killer = self._find_likely_killer(victim)
 
-        kill_data = {
-            "victim_id": victim.id,
-            "victim": victim.champion,
-            "victim_team": victim.team,
-            "killer_id": killer.id if killer else None,
-            "killer": killer.champion if killer else "Unknown",
-            "killer_team": killer.team if killer else None,
-        }
+        if killer:
+            values = (victim.id, victim.champion, victim.team,
+                      killer.id, killer.champion, killer.team)
+        else:
+            values = (victim.id, victim.champion, victim.team,
+                      None, "Unknown", None)
+        kill_data = dict(zip(_KILL_KEYS, values))
 
         # First blood
         if not self.first_blood_occurred:
@@ -248,30 +368,22 @@ class EventDetector:
             killer.recent_kills.append(timestamp)
 
             # Clean old kills (10 second window for multikill)
-            killer.recent_kills = [t for t in killer.recent_kills if timestamp - t < 10]
+            recent = killer.recent_kills
+            while recent and timestamp - recent[0] >= 10:
+                recent.popleft()
 
             # Check for multikill
-            recent_count = len(killer.recent_kills)
-            if recent_count == 2:
-                events.append(GameEvent(
-                    event_type=EventType.DOUBLE_KILL,
-                    timestamp=timestamp,
-                    tick=tick,
-                    data={"champion": killer.champion, "team": killer.team},
-                ))
-            elif recent_count == 3:
+            recent_count = len(recent)
+            if recent_count >= 2:
+                event_type = _MULTIKILL.get(recent_count, EventType.MULTI_KILL)
+                killer_meta = {"champion": killer.champion, "team": killer.team}
+                if event_type is EventType.MULTI_KILL:
+                    killer_meta["count"] = recent_count
                 events.append(GameEvent(
-                    event_type=EventType.TRIPLE_KILL,
+                    event_type=event_type,
                     timestamp=timestamp,
                     tick=tick,
-                    data={"champion": killer.champion, "team": killer.team},
-                ))
-            elif recent_count > 3:
-                events.append(GameEvent(
-                    event_type=EventType.MULTI_KILL,
-                    timestamp=timestamp,
-                    tick=tick,
-                    data={"champion": killer.champion, "team": killer.team, "count": recent_count},
+                    data=killer_meta,
                 ))
 
             # Shutdown (ended a 3+ kill streak)
@@ -287,73 +399,136 @@ class EventDetector:
                     },
                 ))
 
-        return events
-
     def _find_likely_killer(self, victim: ChampionState) -> Optional[ChampionState]:
         """Find the most likely killer (closest enemy)."""
-        enemy_team = "red" if victim.team == "blue" else "blue"
+        enemy_id = 1 - victim.team_id
+
+        if self.use_grid:
+            found = self._grid_killer(victim, enemy_id)
+            if found is not None:
+                return found
+            # No enemy in the neighborhood; fall through to the full scan
+
+        if np is not None and self._slot_states:
+            n = len(self._slot_states)
+            mask = (self._team_ids[:n] == enemy_id) & self._alive[:n]
+            if not mask.any():
+                return None
+            dx = self._pos_x[:n] - victim.position["x"]
+            dy = self._pos_y[:n] - victim.position["y"]
+            dist_sq = np.where(mask, dx * dx + dy * dy, np.inf)
+            return self._slot_states[int(np.argmin(dist_sq))]
+
+        # Squared distances order the same as true distances, so the
+        # fallback scan skips the square root entirely
+        vx = victim.position["x"]
+        vy = victim.position["y"]
         closest = None
-        closest_dist = float("inf")
+        closest_dist_sq = float("inf")
 
         for champ in self.champion_states.values():
-            if champ.team != enemy_team or not champ.is_alive:
+            if champ.team_id != enemy_id or not champ.is_alive:
                 continue
 
-            dist = (
-                (champ.position["x"] - victim.position["x"]) ** 2 +
-                (champ.position["y"] - victim.position["y"]) ** 2
-            ) ** 0.5
+            pos = champ.position
+            dx = pos["x"] - vx
+            dy = pos["y"] - vy
+            dist_sq = dx * dx + dy * dy
 
-            if dist < closest_dist:
+            if dist_sq < closest_dist_sq:
                 closest = champ
-                closest_dist = dist
+                closest_dist_sq = dist_sq
 
         return closest
 
-    def _check_ace(self, tick: int, timestamp: float) -> List[GameEvent]:
-        """Check if either team has been aced."""
-        events = []
+    def _grid_killer(
+        self, victim: ChampionState, enemy_id: int
+    ) -> Optional[ChampionState]:
+        """Closest living enemy within the victim's 3x3 cell neighborhood."""
+        grid = self._grids[enemy_id]
+        vx = victim.position["x"]
+        vy = victim.position["y"]
+        cx = int(vx / _CELL_SIZE)
+        cy = int(vy / _CELL_SIZE)
 
-        for team in ["blue", "red"]:
-            alive = sum(
-                1 for c in self.champion_states.values()
-                if c.team == team and c.is_alive
-            )
+        closest = None
+        closest_dist_sq = float("inf")
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                for slot in grid.get((gx, gy), ()):
+                    champ = self._slot_states[slot]
+                    if not champ.is_alive:
+                        continue
+                    dist_sq = (
+                        (champ.position["x"] - vx) ** 2 +
+                        (champ.position["y"] - vy) ** 2
+                    )
+                    if dist_sq < closest_dist_sq:
+                        closest = champ
+                        closest_dist_sq = dist_sq
 
-            prev_alive = self.team_alive_count.get(team, 0)
+        return closest
 
-            if prev_alive > 0 and alive == 0:
-                enemy_team = "red" if team == "blue" else "blue"
-                events.append(GameEvent(
-                    event_type=EventType.ACE,
-                    timestamp=timestamp,
-                    tick=tick,
-                    data={"aced_team": team, "by_team": enemy_team},
-                ))
+    def _check_ace(
+        self, state: Dict, tick: int, timestamp: float,
+        events: List[GameEvent],
+    ) -> None:
+        """Check if either team has been aced, appending events to events."""
+        if count_alive is not None and np is not None:
+            n = len(self._slot_states)
+            count_alive(self._team_ids[:n], self._alive[:n], self._alive_counts)
+            blue_alive = int(self._alive_counts[_BLUE])
+            red_alive = int(self._alive_counts[_RED])
+        else:
+            blue_alive = red_alive = 0
+            for c in self.champion_states.values():
+                if c.is_alive:
+                    if c.team_id == _BLUE:
+                        blue_alive += 1
+                    else:
+                        red_alive += 1
 
-            self.team_alive_count[team] = alive
+        counts = self.team_alive_count
 
-        return events
+        if counts["blue"] > 0 and blue_alive == 0:
+            events.append(GameEvent(
+                event_type=EventType.ACE,
+                timestamp=timestamp,
+                tick=tick,
+                data={"aced_team": "blue", "by_team": _ENEMY_NAME[_BLUE]},
+            ))
+        counts["blue"] = blue_alive
 
-    def _process_structures(
-        self, state: Dict, tick: int, timestamp: float
-    ) -> List[GameEvent]:
-        """Process structure state changes."""
-        events = []
+        if counts["red"] > 0 and red_alive == 0:
+            events.append(GameEvent(
+                event_type=EventType.ACE,
+                timestamp=timestamp,
+                tick=tick,
+                data={"aced_team": "red", "by_team": _ENEMY_NAME[_RED]},
+            ))
+        counts["red"] = red_alive
 
-        # Check nexus health
+    def _process_structures(
+        self, state: Dict, tick: int, timestamp: float,
+        events: List[GameEvent],
+    ) -> None:
+        """Process structure state changes, appending events to events."""
+        # Check nexus health; fire once per drop below the threshold
+        # instead of every tick the nexus stays low
         for team in ["blue", "red"]:
             key = f"{team}_nexus_health"
             nexus_health = state.get(key, 5000)
 
             if nexus_health <= 1000 and nexus_health > 0:
-                events.append(GameEvent(
-                    event_type=EventType.NEXUS_LOW,
-                    timestamp=timestamp,
-                    tick=tick,
-                    data={"team": team, "health": nexus_health},
-                ))
+                if not self._nexus_low[team]:
+                    self._nexus_low[team] = True
+                    events.append(GameEvent(
+                        event_type=EventType.NEXUS_LOW,
+                        timestamp=timestamp,
+                        tick=tick,
+                        data={"team": team, "health": nexus_health},
+                    ))
+            elif nexus_health > 1000:
+                self._nexus_low[team] = False
 
         # Tower tracking would go here (need tower data in state)
-
-        return events
@@ -9,16 +9,41 @@ Generates real-time commentary for matches using a hybrid approach:
 
 import asyncio
 import json
+import logging
 import os
 from typing import Optional
 
 import structlog
 import websockets
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        # Spectators JSON.parse text frames, so decode orjson's bytes
+        return orjson.dumps(obj).decode()
+
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+
 from event_detector import EventDetector
 from commentary_generator import CommentaryGenerator
 from tts_engine import TTSEngine
 
+# Filter at INFO by default: unconfigured structlog logs everything, so
+# the per-spectator debug lines would still build their event dict and run
+# the processor chain. The filtering wrapper makes them return early.
+LOG_LEVEL = getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
+structlog.configure(
+    wrapper_class=structlog.make_filtering_bound_logger(LOG_LEVEL),
+)
+
 log = structlog.get_logger()
 
 # Configuration
@@ -36,14 +61,24 @@ class CommentaryEngine:
         self.event_detector = EventDetector()
         self.commentary_gen = CommentaryGenerator(enable_llm=ENABLE_LLM)
         self.tts_engine = TTSEngine() if ENABLE_TTS else None
-        self.spectators: set[websockets.WebSocketServerProtocol] = set()
+        # Spectator socket -> its bounded send queue; each connection has
+        # a pump task so a slow peer only backs up its own queue
+        self.spectators: dict[websockets.WebSocketServerProtocol, asyncio.Queue] = {}
         self.running = False
+        # Single LLM consumer; bounded so stale events are dropped rather
+        # than piling up concurrent requests during a teamfight
+        self._llm_q: Optional[asyncio.Queue] = None
+        self._llm_task: Optional[asyncio.Task] = None
 
     async def start(self):
         """Start the commentary engine."""
         log.info("Starting commentary engine", match_id=self.match_id)
         self.running = True
 
+        if ENABLE_LLM:
+            self._llm_q = asyncio.Queue(maxsize=2)
+            self._llm_task = asyncio.create_task(self._llm_worker())
+
         # Start broadcast server
         broadcast_server = await websockets.serve(
             self.handle_spectator,
@@ -65,12 +100,12 @@ class CommentaryEngine:
         try:
             async with websockets.connect(url) as ws:
                 # Send spectate request
-                await ws.send(json.dumps({"type": "spectate"}))
+                await ws.send(_dumps({"type": "spectate"}))
 
                 while self.running:
                     try:
                         message = await ws.recv()
-                        data = json.loads(message)
+                        data = _loads(message)
                         await self.process_game_update(data)
                     except websockets.ConnectionClosed:
                         log.warning("Match connection closed")
@@ -84,6 +119,10 @@ class CommentaryEngine:
         events = self.event_detector.detect(data)
 
         for event in events:
+            # Skip event types with no commentary line before doing any work
+            if not self.commentary_gen.has_template(event.event_type):
+                continue
+
             # Generate template-based commentary (fast)
             commentary = self.commentary_gen.generate_template(event)
 
@@ -91,13 +130,28 @@ class CommentaryEngine:
                 await self.broadcast_commentary(commentary, event.event_type)
 
                 # Optionally enhance with LLM (async, non-blocking)
-                if ENABLE_LLM and event.is_major:
-                    asyncio.create_task(self.enhance_commentary(event))
+                if self._llm_q is not None and event.is_major:
+                    self._queue_llm(event)
 
                 # TTS if enabled
                 if self.tts_engine and event.is_major:
                     asyncio.create_task(self.speak_commentary(commentary))
 
+    def _queue_llm(self, event):
+        """Queue an event for LLM enhancement, dropping the oldest when full."""
+        if self._llm_q.full():
+            try:
+                self._llm_q.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        self._llm_q.put_nowait(event)
+
+    async def _llm_worker(self):
+        """Enhance queued events one at a time."""
+        while True:
+            event = await self._llm_q.get()
+            await self.enhance_commentary(event)
+
     async def enhance_commentary(self, event):
         """Enhance commentary with LLM (runs async)."""
         try:
@@ -114,34 +168,52 @@ class CommentaryEngine:
 
     async def broadcast_commentary(self, text: str, commentary_type: str = "normal"):
         """Broadcast commentary to all spectators."""
-        message = json.dumps({
+        if not self.spectators:
+            return
+
+        message = _dumps({
             "type": "commentary",
             "text": text,
             "commentaryType": commentary_type,
-            "timestamp": asyncio.get_event_loop().time(),
+            "timestamp": asyncio.get_running_loop().time(),
         })
 
-        disconnected = set()
-        for ws in self.spectators:
-            try:
-                await ws.send(message)
-            except websockets.ConnectionClosed:
-                disconnected.add(ws)
-
-        self.spectators -= disconnected
+        # Hand the line to each spectator's pump; when a queue is full the
+        # peer is too slow, so its oldest line is dropped for the newest
+        for queue in self.spectators.values():
+            if queue.full():
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+            queue.put_nowait(message)
+
+    async def _pump_spectator(self, websocket, queue: asyncio.Queue):
+        """Send queued commentary to one spectator at its own pace."""
+        try:
+            while True:
+                await websocket.send(await queue.get())
+        except websockets.ConnectionClosed:
+            pass
 
     async def handle_spectator(self, websocket: websockets.WebSocketServerProtocol):
         """Handle a new spectator connection."""
-        self.spectators.add(websocket)
-        log.info("Spectator connected", total=len(self.spectators))
+        queue: asyncio.Queue = asyncio.Queue(maxsize=32)
+        pump = asyncio.create_task(self._pump_spectator(websocket, queue))
+        self.spectators[websocket] = queue
+        # Debug level: during spectator churn these fire per connection, and
+        # structlog builds the event dict and runs the processor chain even
+        # for lines nobody reads at the default level.
+        log.debug("Spectator connected", total=len(self.spectators))
 
         try:
             async for message in websocket:
                 # Spectators are read-only for now
                 pass
         finally:
-            self.spectators.discard(websocket)
-            log.info("Spectator disconnected", total=len(self.spectators))
+            self.spectators.pop(websocket, None)
+            pump.cancel()
+            log.debug("Spectator disconnected", total=len(self.spectators))
 
 
 async def main():
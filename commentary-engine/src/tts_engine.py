@@ -5,15 +5,29 @@ Handles text-to-speech for spoken commentary.
 """
 
 import asyncio
+import queue
+import threading
 from typing import Optional
 
 
+def _resolve(future: asyncio.Future, value: bool) -> None:
+    if not future.done():
+        future.set_result(value)
+
+
 class TTSEngine:
-    """Text-to-speech engine for commentary."""
+    """Text-to-speech engine for commentary.
+
+    Speech runs on a single dedicated worker thread: pyttsx3 engines are
+    not thread-safe, so one owner thread serializes utterances instead of
+    bouncing the engine across executor pool threads.
+    """
 
     def __init__(self, engine: str = "pyttsx3"):
         self.engine_type = engine
         self.engine = None
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
         self._init_engine()
 
     def _init_engine(self):
@@ -36,19 +50,51 @@ class TTSEngine:
                 print(f"Failed to initialize pyttsx3: {e}")
                 self.engine = None
 
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._worker_loop, name="tts-worker", daemon=True
+            )
+            self._worker.start()
+
+    def _drain_pending(self):
+        """Resolve any queued utterances with False so callers never hang."""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is None:
+                continue
+            _text, loop, future = item
+            loop.call_soon_threadsafe(_resolve, future, False)
+
+    def _worker_loop(self):
+        """Pull utterances off the queue and speak them in order."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._drain_pending()
+                return
+            text, loop, future = item
+            try:
+                self._speak_sync(text)
+            except Exception as e:
+                print(f"TTS error: {e}")
+                loop.call_soon_threadsafe(_resolve, future, False)
+            else:
+                loop.call_soon_threadsafe(_resolve, future, True)
+
     async def speak(self, text: str) -> bool:
         """Speak text asynchronously."""
         if not self.engine:
             return False
 
-        # Run TTS in thread pool to not block
-        loop = asyncio.get_event_loop()
-        try:
-            await loop.run_in_executor(None, self._speak_sync, text)
-            return True
-        except Exception as e:
-            print(f"TTS error: {e}")
-            return False
+        self._ensure_worker()
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._queue.put((text, loop, future))
+        return await future
 
     def _speak_sync(self, text: str):
         """Synchronous speak method."""
@@ -57,12 +103,16 @@ class TTSEngine:
             self.engine.runAndWait()
 
     def stop(self):
-        """Stop any ongoing speech."""
+        """Stop any ongoing speech and shut the worker down."""
         if self.engine:
             try:
                 self.engine.stop()
             except:
                 pass
+        # Only signal a live worker; a sentinel left in an idle queue would
+        # make the next speak()'s fresh worker exit without serving it
+        if self._worker is not None and self._worker.is_alive():
+            self._queue.put(None)
 
 
 class GTTSEngine: